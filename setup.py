@@ -1,3 +1,14 @@
+import os
+
 from setuptools import setup
 
-setup()
\ No newline at end of file
+ext_modules = []
+
+# The parsers are compiled with mypyc; set YAHOO_SEARCH_PURE_PYTHON=1 to
+# build a pure Python package instead (e.g. where there's no C compiler).
+if not os.environ.get("YAHOO_SEARCH_PURE_PYTHON"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["yahoo_search/_parsers.py"])
+
+setup(ext_modules=ext_modules)
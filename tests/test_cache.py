@@ -0,0 +1,264 @@
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from yahoo_search import _cache, core
+from yahoo_search._cache import ttl_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeExecutor:
+    """Collects submitted refreshes; ``run()`` runs them on this thread."""
+
+    def __init__(self) -> None:
+        self.tasks: List[Callable[[], Any]] = []
+
+    def submit(self, fn, *args, **kwargs) -> None:
+        self.tasks.append(lambda: fn(*args, **kwargs))
+
+    def run(self) -> None:
+        tasks, self.tasks = self.tasks, []
+
+        for task in tasks:
+            task()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(_cache, "_clock", clock)
+    return clock
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = FakeExecutor()
+    monkeypatch.setattr(_cache, "_EXECUTOR", executor)
+    return executor
+
+
+def counting(maxsize: int = 512, ttl: float = 60):
+    calls = []
+
+    @ttl_cache(maxsize=maxsize, ttl=ttl)
+    def func(x):
+        calls.append(x)
+        return [x, len(calls)]
+
+    return func, calls
+
+
+def test_hit_skips_the_call(clock, executor):
+    func, calls = counting()
+
+    assert func("a") == ["a", 1]
+    assert func("a") == ["a", 1]
+    assert func("b") == ["b", 2]
+    assert calls == ["a", "b"]
+
+
+def test_returns_copies(clock, executor):
+    func, _ = counting()
+
+    func("a").append("changed")
+    first = func("a")
+    first.append("changed")
+
+    assert func("a") == ["a", 1]
+
+
+def test_expires_after_ttl(clock, executor):
+    func, calls = counting(ttl=60)
+
+    func("a")
+    clock.now += 60
+    assert func("a") == ["a", 2]
+    assert calls == ["a", "a"]
+
+
+def test_evicts_least_recently_used(clock, executor):
+    func, calls = counting(maxsize=2)
+
+    func("a")
+    func("b")
+    func("a") # "b" is now the least recently used
+    func("c")
+
+    func("a")
+    assert calls == ["a", "b", "c"]
+    func("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_stale_entry_is_served_while_refreshing(clock, executor):
+    func, calls = counting(ttl=60)
+
+    func("a")
+    clock.now += 31
+
+    assert func("a") == ["a", 1] # stale, but still served
+    assert len(executor.tasks) == 1
+
+    executor.run()
+    assert calls == ["a", "a"]
+    assert func("a") == ["a", 2]
+
+
+def test_one_refresh_per_key(clock, executor):
+    func, _ = counting(ttl=60)
+
+    func("a")
+    func("b")
+    clock.now += 31
+
+    func("a")
+    func("a")
+    func("b")
+    assert len(executor.tasks) == 2
+
+    executor.run()
+    clock.now += 31
+    func("a")
+    assert len(executor.tasks) == 1
+
+
+def test_failed_refresh_keeps_old_entry(clock, executor):
+    fail = False
+
+    @ttl_cache(ttl=60)
+    def func(x):
+        if fail:
+            raise RuntimeError("network down")
+        return x
+
+    func("a")
+    clock.now += 31
+    fail = True
+    func("a")
+    executor.run() # error is swallowed
+
+    assert func("a") == "a"
+    assert len(executor.tasks) == 1 # can be refreshed again
+
+    clock.now += 30
+    with pytest.raises(RuntimeError):
+        func("a")
+
+
+def test_cache_clear(clock, executor):
+    func, calls = counting()
+
+    func("a")
+    func.cache_clear()
+    func("a")
+    assert calls == ["a", "a"]
+
+
+SEARCH_HTML = b"""<html><body>
+<ol class="cardReg searchTop"><li><div class="compDlink"><ul>
+<li><span><a href="https://example.com/also">also</a></span></li>
+</ul></div></li></ol>
+<div class="reg searchCenterMiddle"><ol><li><div class="dd algo algo-sr">
+<div class="compTitle"><h3><a href="https://r.search.yahoo.com/RU=https%3a%2f%2fexample.com%2f/RK=2">Example</a></h3></div>
+<div class="compText aAbs"><p>Example <b>page</b></p></div>
+</div></li></ol></div>
+<div class="cardReg searchRightTop"><img src="https://s.yimg.com/x/https://example.com/a.png">
+<div class="compText"><p>Card text<a href="https://r.search.yahoo.com/RU=https%3a%2f%2fexample.org%2f/RK=2">Example</a></p></div>
+</div>
+<ol class="scf reg searchCenterFooter"><table><tbody><tr>
+<td><a href="https://example.com/related">related</a></td>
+</tr></tbody></table></ol>
+</body></html>"""
+
+WEATHER_START = """<html><body>
+<div class="M(10px)"><h1>Singapore</h1></div><h2 class="D(b)">Singapore</h2>
+<time>9:00 AM</time>
+<span class="celsius celsius_D(b)">30</span><span class="fahrenheit">86</span>
+<div id="module-location-heading"><img src="https://example.com/haze.png"><p>Haze</p></div>
+<table data-slk="sec:forecast;"><tbody><tr>"""
+# (no whitespace between the cells: the parser walks first_child/last_child)
+FORECAST_ROW = (
+    '<td><span>x</span><span>Monday</span></td>'
+    '<td class="Ta(c)"><img alt="Haze" src="https://example.com/haze.png"></td>'
+    '<td class="D(f) Jc(c)"><img src="https://example.com/rain.png">'
+    '<span><span>10%</span></span></td>'
+    '<td class="D(f) Jc(fe) Ta(end)"><dl>'
+    '<dd>90°</dd><dd>32°</dd><dd>70°</dd><dd>21°</dd></dl></td>'
+)
+WEATHER_END = """</tr></tbody></table>
+</body></html>"""
+
+
+def weather_html(row: str = FORECAST_ROW) -> bytes:
+    return (WEATHER_START + row + WEATHER_END).encode()
+
+
+@pytest.fixture
+def fake_yahoo(monkeypatch):
+    """Serves ``responses[path]`` for every request and records the paths."""
+    responses = {}
+    requests: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, content=responses[request.url.path])
+
+    monkeypatch.setattr(
+        core, "_CLIENT", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    for func in (core.search, core.weather, core.autocomplete):
+        func.cache_clear()
+
+    yield responses, requests
+
+    for func in (core.search, core.weather, core.autocomplete):
+        func.cache_clear()
+
+
+def test_autocomplete_is_cached(clock, executor, fake_yahoo):
+    responses, requests = fake_yahoo
+    responses["/gossip"] = b'["hel", ["hello", "help"]]'
+
+    core.autocomplete("hel").append("mutated")
+    assert core.autocomplete("hel") == ["hello", "help"]
+    assert len(requests) == 1
+
+
+def test_search_is_cached(clock, executor, fake_yahoo):
+    responses, requests = fake_yahoo
+    responses["/search"] = SEARCH_HTML
+
+    first = core.search("chocolate")
+    first.pages.clear()
+    second = core.search("chocolate")
+
+    assert len(requests) == 1
+    assert second.also_try[0].link == "https://example.com/also"
+    assert second.pages[0].link == "https://example.com/"
+    assert second.card is not None and second.card.source is not None
+    assert second.card.source.link == "https://example.org/"
+    assert second.related_searches[0].link == "https://example.com/related"
+
+
+def test_weather_is_cached(clock, executor, fake_yahoo):
+    responses, requests = fake_yahoo
+    responses["/weather/"] = weather_html()
+
+    first = core.weather()
+    first.forecast.clear()
+    second = core.weather()
+
+    assert len(requests) == 1
+    monday = second.forecast["Monday"]
+    assert (monday.fahrenheit.highest, monday.celsius.lowest) == (90, 21)
+    assert monday.weather.text == "Haze"
+    assert monday.precipitation.percentage == "10%"
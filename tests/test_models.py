@@ -0,0 +1,57 @@
+import copy
+import pickle
+
+import pytest
+
+from yahoo_search.models import (
+    AlsoTryItem,
+    CardResult,
+    CardResultSource,
+    HighLowTemperature,
+    Precipitation,
+    RelatedSearch,
+    SearchResult,
+    WeatherForecast,
+    WeatherForecastInner,
+)
+
+LEAVES = [
+    AlsoTryItem("https://example.com/a", "a"),
+    CardResultSource("https://example.com/b", "b"),
+    RelatedSearch("https://example.com/c", "c"),
+    HighLowTemperature(90, 70),
+    WeatherForecastInner("Haze", "https://example.com/haze.png"),
+    Precipitation("https://example.com/rain.png", "10%"),
+]
+
+
+@pytest.mark.parametrize("value", LEAVES, ids=lambda value: type(value).__name__)
+def test_leaf_round_trips(value):
+    assert pickle.loads(pickle.dumps(value)) == value
+    assert copy.copy(value) == value
+    assert copy.deepcopy(value) == value
+
+
+@pytest.mark.parametrize("value", LEAVES, ids=lambda value: type(value).__name__)
+def test_leaf_copies_are_shared(value):
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value
+
+
+def test_results_round_trip():
+    result = SearchResult(
+        also_try=[LEAVES[0]],
+        pages=[],
+        card=CardResult(heading="Chocolate", source=LEAVES[1]),
+        related_searches=[LEAVES[2]],
+    )
+    forecast = WeatherForecast(
+        fahrenheit=LEAVES[3],
+        celsius=HighLowTemperature(32, 21),
+        weather=LEAVES[4],
+        precipitation=LEAVES[5],
+    )
+
+    for value in (result, forecast):
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.deepcopy(value) == value
@@ -0,0 +1,70 @@
+import pydantic
+import pytest
+
+from yahoo_search._parsers import parse_search, parse_weather
+
+# The second card has no title link
+SEARCH_HTML = b"""<html><body>
+<div class="reg searchCenterMiddle"><ol>
+<li><div class="dd algo algo-sr">
+<div class="compTitle"><h3><a href="https://r.search.yahoo.com/RU=https%3a%2f%2fexample.com%2f/RK=2">Example</a></h3></div>
+<div class="compText aAbs"><p>Example page</p></div>
+</div></li>
+<li><div class="dd algo algo-sr">
+<div class="compText aAbs"><p>No title</p></div>
+</div></li>
+</ol></div>
+</body></html>"""
+
+
+WEATHER_HTML = """<html><body>
+<div class="M(10px)"><h1>Singapore</h1></div><h2 class="D(b)">Singapore</h2>
+<time>9:00 AM</time>
+<span class="celsius celsius_D(b)">30</span><span class="fahrenheit">86</span>
+<div id="module-location-heading"><img src="https://example.com/haze.png"><p>Haze</p></div>
+<table data-slk="sec:forecast;"><tbody>{}</tbody></table>
+</body></html>"""
+
+
+def forecast_row(day: str, *temperatures: str) -> str:
+    # (no whitespace between the cells: the parser walks first_child/last_child)
+    return (
+        '<tr><td><span>x</span><span>{}</span></td>'
+        '<td class="Ta(c)"><img alt="Haze" src="https://example.com/haze.png"></td>'
+        '<td class="D(f) Jc(c)"><img src="https://example.com/rain.png">'
+        '<span><span>10%</span></span></td>'
+        '<td class="D(f) Jc(fe) Ta(end)"><dl>{}</dl></td></tr>'
+    ).format(day, "".join("<dd>{}</dd>".format(t) for t in temperatures))
+
+
+def test_incomplete_cards_are_skipped():
+    result = parse_search(SEARCH_HTML)
+
+    assert [page.title for page in result.pages] == ["Example"]
+
+
+def test_incomplete_cards_fail_validation():
+    with pytest.raises(pydantic.ValidationError):
+        parse_search(SEARCH_HTML, validate=True)
+
+
+def test_forecast_temperatures_with_nested_markup():
+    html = WEATHER_HTML.format(
+        forecast_row("Monday", "<span>92</span>°", "33°", "<span>-1</span>°", "-18°")
+    )
+    monday = parse_weather(html.encode()).forecast["Monday"]
+
+    assert (monday.fahrenheit.highest, monday.celsius.highest) == (92, 33)
+    assert (monday.fahrenheit.lowest, monday.celsius.lowest) == (-1, -18)
+
+
+def test_forecast_days_with_missing_temperatures_are_skipped():
+    html = WEATHER_HTML.format(
+        forecast_row("Monday", "92°", "33°", "--", "--")
+        + forecast_row("Tuesday", "90°", "32°", "", "21°")
+        + forecast_row("Wednesday", "91°", "32°", "78°", "25°")
+    )
+    forecast = parse_weather(html.encode()).forecast
+
+    assert list(forecast) == ["Wednesday"]
+    assert forecast["Wednesday"].celsius.lowest == 25
@@ -1,20 +1,40 @@
 from .core import (
+    AllSearchResult,
     SearchResult,
     VideoSearchResult,
     WeatherInformation,
+    YahooParseError,
+    aautocomplete,
+    aclose,
+    asearch,
+    asearch_all,
+    asearch_news,
+    asearch_videos,
     autocomplete,
+    aweather,
     search,
+    search_all,
     search_news,
     search_videos,
     weather,
 )
 
 __all__ = (
+    'AllSearchResult',
     'SearchResult',
     'VideoSearchResult',
     'WeatherInformation',
+    'YahooParseError',
+    'aautocomplete',
+    'aclose',
+    'asearch',
+    'asearch_all',
+    'asearch_news',
+    'asearch_videos',
     'autocomplete',
+    'aweather',
     'search',
+    'search_all',
     'search_news',
     'search_videos',
     'weather'
@@ -0,0 +1,491 @@
+"""HTML parsers for each Yahoo endpoint.
+
+Kept apart from the HTTP code in ``core`` and fully annotated, so that this
+module can be compiled with mypyc; ``setup.py`` does so when building.
+"""
+
+import functools
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Type
+from urllib.parse import unquote, urlsplit
+
+import orjson
+from pydantic import BaseModel
+from selectolax.lexbor import LexborHTMLParser as Parser
+from selectolax.lexbor import LexborNode
+
+from .errors import YahooParseError
+from .models import (
+    AlsoTryItem,
+    CardResult,
+    CardResultSource,
+    HighLowTemperature,
+    News,
+    NewsSearchResult,
+    PageResult,
+    Precipitation,
+    RelatedSearch,
+    SearchResult,
+    Video,
+    VideoSearchResult,
+    WeatherForecast,
+    WeatherForecastInner,
+    WeatherInformation,
+)
+
+MD_TAGS = ["strong", "b", "s", "i"]
+_RU_RE = re.compile(r"RU=([^/]*)")
+
+# CSS selectors, grouped by the function that uses them.
+
+# search()
+_SEL_SEARCH = ".reg.searchCenterMiddle"
+_SEL_ALGO = ".dd.algo.algo-sr"
+_SEL_ALGO_TITLE = "div.compTitle h3 a"
+_SEL_ALGO_TEXT = ".compText.aAbs p"
+_SEL_CARD = ".cardReg.searchRightTop"
+_SEL_CARD_HEADING = 'p.pl-15.pr-10 span'
+_SEL_CARD_TEXT = 'div.compText p'
+_SEL_ALSO_TRY_ROOT = 'ol.cardReg.searchTop'
+_SEL_ALSO_TRY = '.compDlink li span a'
+_SEL_RELATED_SEARCHES_ROOT = 'ol.scf.reg.searchCenterFooter'
+_SEL_RELATED_SEARCHES = 'tbody tr td a'
+
+# search_news()
+_SEL_NEWS_PAGE = '#main #web'
+_SEL_NEWS = 'li .dd.NewsArticle li'
+_SEL_NEWS_TITLE = 'h4 a'
+_SEL_NEWS_SOURCE = 'span.s-source'
+_SEL_NEWS_TIME = 'span.fc-2nd.s-time'
+_SEL_NEWS_TEXT = 'p.s-desc'
+
+# search_videos()
+_SEL_VIDEOS = '#search li.vr.vres'
+_SEL_VIDEO_DURATION = 'div.pos-box .vthm .stack.grad span.v-time'
+_SEL_VIDEO_META = 'div.v-meta'
+_SEL_VIDEO_AGE = '.v-age'
+
+# weather()
+_SEL_WEATHER_LOCATION = 'div.M\\(10px\\) h1'
+_SEL_WEATHER_COUNTRY = 'h2.D\\(b\\)'
+_SEL_WEATHER_CELSIUS = '.celsius.celsius_D\\(b\\)'
+_SEL_WEATHER_FAHRENHEIT = '.fahrenheit'
+_SEL_WEATHER_HEADING = 'div#module-location-heading'
+_SEL_FORECAST = 'table[data-slk="sec:forecast;"] tbody'
+_SEL_FORECAST_WEATHER = 'td.Ta\\(c\\) img'
+_SEL_FORECAST_PRECIPITATION = 'td.D\\(f\\).Jc\\(c\\)'
+_SEL_FORECAST_TEMPERATURES = 'td.D\\(f\\).Jc\\(fe\\).Ta\\(end\\) dl'
+
+def _group_by_row(nodes: List[LexborNode]) -> Dict[int, List[LexborNode]]:
+    """Groups table cell nodes by the ``mem_id`` of the ``<tr>`` they're in."""
+    rows: Dict[int, List[LexborNode]] = {}
+
+    for node in nodes:
+        row = node.parent
+
+        while row is not None and row.tag != "tr":
+            row = row.parent
+
+        if row is not None:
+            rows.setdefault(row.mem_id, []).append(node)
+
+    return rows
+
+def _required_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Names of the required fields of ``model``."""
+    return frozenset(
+        name for name, field in model.model_fields.items() if field.is_required()
+    )
+
+# Looked up for every card, so worked out once here
+_PAGE_REQUIRED = _required_fields(PageResult)
+_NEWS_REQUIRED = _required_fields(News)
+_VIDEO_REQUIRED = _required_fields(Video)
+_FORECAST_REQUIRED = _required_fields(WeatherForecast)
+# (the forecast is added last)
+_WEATHER_REQUIRED = _required_fields(WeatherInformation) - {"forecast"}
+
+@functools.lru_cache(maxsize=4096)
+def get_abs_link(r_search_link: Optional[str]) -> str:
+    if not r_search_link:
+        return ""
+
+    match = _RU_RE.search(urlsplit(r_search_link).path)
+    return unquote(match.group(1)) if match else ""
+
+def get_abs_image(yimg_link: Optional[str]) -> str:
+    if not yimg_link:
+        return ""
+
+    _, sep, tail = yimg_link.rpartition('https://')
+    return "https://" + tail if sep else ""
+
+def parse_search(
+    html: bytes,
+    max_results: int = 0,
+    validate: bool = False
+) -> SearchResult:
+    parser = Parser(html)
+    search = parser.css_first(_SEL_SEARCH)
+    also_try: List[Dict[str, Any]] = []
+    pages: List[Dict[str, Any]] = []
+    card: Dict[str, Any] = {}
+    related_searches: List[Dict[str, Any]] = []
+
+    if not search:
+        raise YahooParseError(
+            "Could not find '.reg.searchCenterMiddle' (search results)"
+        )
+
+    for webpage in search.css(_SEL_ALGO):
+        if max_results and len(pages) >= max_results:
+            break
+
+        page_results: Dict[str, Any] = {}
+    
+        title = webpage.css_first(_SEL_ALGO_TITLE)
+
+        if title:
+            link = title.attrs['href']
+            absLink = get_abs_link(link)
+            page_results["title"] = title.last_child.text() if title.last_child else ""
+            page_results["link"] = absLink
+
+        texts = webpage.css_first(_SEL_ALGO_TEXT)
+
+        if texts:
+            texts.unwrap_tags(MD_TAGS)
+            page_results["text"] = texts.text(deep=True, separator=" ", strip=True)
+
+        # Cards without a title link aren't web page results; when
+        # validating, they're kept so that Pydantic reports them
+        if validate or _PAGE_REQUIRED.issubset(page_results):
+            pages.append(page_results)
+
+    card_node = parser.css_first(_SEL_CARD)
+
+    if card_node:
+        image = card_node.css_first('img')
+
+        if image:
+            card["image"] = get_abs_image(
+                image.attrs['src']
+            )
+
+        heading_2 = card_node.css_first(_SEL_CARD_HEADING)
+
+        if heading_2:
+            heading_2.unwrap_tags(MD_TAGS)
+            card["heading"] = heading_2.text(deep=True, separator=" ", strip=True)
+
+        inner_content = card_node.css_first(_SEL_CARD_TEXT)
+
+        if inner_content:
+            first = inner_content.first_child
+            card["text"] = first.text() if first else ""
+
+            source = inner_content.css_first("a")
+    
+            if source:
+                card["source"] = {
+                    "link": get_abs_link(
+                        source.attrs.get("href")
+                    ),
+                    "text": source.text()
+                }
+
+    # Every matching block is read, as the unscoped selectors used to do.
+    for also_try_root in parser.css(_SEL_ALSO_TRY_ROOT):
+        for item in also_try_root.css(_SEL_ALSO_TRY):
+            also_try.append({
+                "link": item.attrs['href'],
+                "text": item.text()
+            })
+
+    for related_searches_root in parser.css(_SEL_RELATED_SEARCHES_ROOT):
+        for item in related_searches_root.css(_SEL_RELATED_SEARCHES):
+            item.unwrap_tags(MD_TAGS)
+            related_searches.append({
+                "link": item.attrs['href'],
+                "text": item.text(deep=True, separator=" ", strip=True)
+            })
+
+    if validate:
+        return SearchResult.model_validate({
+            "also_try": also_try,
+            "pages": pages,
+            "card": card,
+            "related_searches": related_searches
+        })
+
+    if "source" in card:
+        card["source"] = CardResultSource(**card["source"])
+
+    return SearchResult.model_construct(
+        also_try=[AlsoTryItem(**item) for item in also_try],
+        pages=[PageResult.model_construct(**page) for page in pages],
+        card=CardResult.model_construct(**card),
+        related_searches=[RelatedSearch(**item) for item in related_searches]
+    )
+
+def parse_news(
+    html: bytes,
+    max_results: int = 0,
+    validate: bool = False
+) -> NewsSearchResult:
+    parser = Parser(html)
+    page = parser.css_first(_SEL_NEWS_PAGE)
+    if not page:
+        raise YahooParseError("Could not find '#main #web' (news results)")
+
+    contents: List[Dict[str, Any]] = []
+
+    for news in page.css(_SEL_NEWS):
+        if max_results and len(contents) >= max_results:
+            break
+
+        this: Dict[str, Any] = {}
+        thumbnail = news.css_first('img')
+
+        if thumbnail:
+            src = thumbnail.attrs['src']
+            this["thumbnail"] = None if src.startswith('data:image/') else src # type: ignore
+
+        title = news.css_first(_SEL_NEWS_TITLE)
+
+        if title:
+            this["title"] = title.text()
+            this["link"] = title.attrs['href']
+
+        source = news.css_first(_SEL_NEWS_SOURCE)
+
+        if source:
+            this["source"] = source.text()
+
+        last_updated = news.css_first(_SEL_NEWS_TIME)
+
+        if last_updated:
+            this["time"] = last_updated.text()[2:]
+
+        description = news.css_first(_SEL_NEWS_TEXT)
+
+        if description:
+            description.unwrap_tags(MD_TAGS)
+            this["text"] = description.text(deep=True, separator=" ", strip=True)
+
+        if validate or _NEWS_REQUIRED.issubset(this):
+            contents.append(this)
+
+    if validate:
+        return NewsSearchResult.model_validate({"news": contents})
+
+    return NewsSearchResult.model_construct(
+        news=[News.model_construct(**news) for news in contents]
+    )
+
+def parse_videos(
+    html: bytes,
+    max_results: int = 0,
+    validate: bool = False
+) -> VideoSearchResult:
+    parser = Parser(html)
+    contents: List[Dict[str, Any]] = []
+
+    results = parser.css(_SEL_VIDEOS)
+    if not results:
+        raise YahooParseError(
+            "Couldn't find any results for '#search li.vr.vres'"
+        )
+    
+    for result in results:
+        if max_results and len(contents) >= max_results:
+            break
+
+        this: Dict[str, Any] = {}
+        anchor = result.css_first("a")
+
+        if anchor:
+            attrs = anchor.attrs
+            this["link"] = "https://sg.video.search.yahoo.com" + attrs['href'] # type: ignore
+
+            preview = attrs.get("data")
+
+            if preview:
+                meta = orjson.loads(preview)
+                if meta['m']: # sometimes nothing
+                    this["video_preview"] = meta['m']['u']
+
+        thumbnail = result.css_first("img")
+
+        if thumbnail:
+            this["thumbnail"] = thumbnail.attrs['src']
+
+
+        duration = result.css_first(_SEL_VIDEO_DURATION)
+
+        if duration:
+            this["duration"] = duration.text()
+
+        metadata = result.css_first(_SEL_VIDEO_META)
+
+        if metadata:
+            title = metadata.first_child
+
+            if title:
+                title.unwrap_tags(MD_TAGS)
+                this["title"] = title.text(deep=True, separator=" ", strip=True)
+
+            age = metadata.css_first(_SEL_VIDEO_AGE)
+
+            if age:
+                this["age"] = age.text()
+
+            cite = metadata.last_child
+
+            if cite:
+                this["cite"] = cite.text()
+
+        if validate or _VIDEO_REQUIRED.issubset(this):
+            contents.append(this)
+
+    if validate:
+        return VideoSearchResult.model_validate({"videos": contents})
+
+    return VideoSearchResult.model_construct(
+        videos=[Video.model_construct(**video) for video in contents]
+    )
+
+def parse_weather(html: bytes, validate: bool = False) -> WeatherInformation:
+    parser = Parser(html)
+
+    data: Dict[str, Any] = {}
+    forecast: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    location = parser.css_first(_SEL_WEATHER_LOCATION)
+
+    if location:
+        data["location"] = location.text()
+
+    country = parser.css_first(_SEL_WEATHER_COUNTRY)
+
+    if country:
+        data["country"] = country.text()
+
+    now = parser.css_first('time')
+
+    if now:
+        data["time"] = now.text()
+
+    celsius = parser.css_first(_SEL_WEATHER_CELSIUS)
+
+    if celsius:
+        data["celsius"] = int(celsius.text())
+
+    fahrenheit = parser.css_first(_SEL_WEATHER_FAHRENHEIT)
+
+    if fahrenheit:
+        data["fahrenheit"] = int(fahrenheit.text())
+
+    heading = parser.css_first(_SEL_WEATHER_HEADING)
+
+    if heading:
+        img = heading.css_first('img')
+
+        if img:
+            data["weather_icon"] = img.attrs['src']
+
+        text = heading.css_first('p')
+
+        if text:
+            data["weather"] = text.text()
+
+        weather_table = parser.css_first(_SEL_FORECAST)
+
+        if weather_table:
+            # One walk over the whole table per column, instead of one per row
+            weathers = _group_by_row(weather_table.css(_SEL_FORECAST_WEATHER))
+            precipitations = _group_by_row(
+                weather_table.css(_SEL_FORECAST_PRECIPITATION)
+            )
+            temperatures = _group_by_row(
+                weather_table.css(_SEL_FORECAST_TEMPERATURES)
+            )
+
+            for row in weather_table.css('tr')[:7]:
+                row_id = row.mem_id
+                day = row.first_child.last_child.text() # type: ignore
+                info: Dict[str, Dict[str, Any]] = {
+                    "fahrenheit": {},
+                    "celsius": {}
+                }
+
+                if row_id in weathers:
+                    attrs = weathers[row_id][0].attrs
+                    info["weather"] = {
+                        "text": attrs['alt'],
+                        "icon": attrs['src']
+                    }
+
+                if row_id in precipitations:
+                    precipitation = precipitations[row_id][0]
+                    icon = precipitation.first_child
+                    percentage = precipitation.last_child.last_child # type: ignore
+                    
+                    info["precipitation"] = {
+                        "icon": icon.attrs['src'], # type: ignore
+                        "percentage": percentage.text() # type: ignore
+                    }
+
+                if row_id in temperatures:
+                    # The <dd>s are high (F), high (C), low (F), low (C)
+                    degrees: List[int] = []
+
+                    for dd in temperatures[row_id][0].iter():
+                        value = dd.text(strip=True).rstrip("°")
+
+                        if dd.tag == "dd" and value.lstrip("-").isdigit():
+                            degrees.append(int(value))
+
+                    # Days with a value missing (e.g. "--") are left without
+                    # temperatures, and so skipped below, rather than having
+                    # the other values read into the wrong fields
+                    if len(degrees) == 4:
+                        info["fahrenheit"]["highest"] = degrees[0]
+                        info["celsius"]["highest"] = degrees[1]
+                        info["fahrenheit"]["lowest"] = degrees[2]
+                        info["celsius"]["lowest"] = degrees[3]
+
+                temperatures_found = all(
+                    key in info[unit]
+                    for unit in ("fahrenheit", "celsius")
+                    for key in ("highest", "lowest")
+                )
+
+                # Skip days the table doesn't have every column for
+                if validate or (
+                    temperatures_found and _FORECAST_REQUIRED.issubset(info)
+                ):
+                    forecast[day] = info
+
+    missing = sorted(_WEATHER_REQUIRED.difference(data))
+
+    if missing:
+        raise YahooParseError(
+            "Could not find {} on the weather page".format(", ".join(missing))
+        )
+
+    if validate:
+        data["forecast"] = forecast
+        return WeatherInformation.model_validate(data)
+
+    data["forecast"] = {
+        day: WeatherForecast.model_construct(
+            fahrenheit=HighLowTemperature(**info["fahrenheit"]),
+            celsius=HighLowTemperature(**info["celsius"]),
+            weather=WeatherForecastInner(**info["weather"]),
+            precipitation=Precipitation(**info["precipitation"])
+        )
+        for day, info in forecast.items()
+    }
+
+    return WeatherInformation.model_construct(**data)
@@ -1,14 +1,49 @@
 """Simple Yahoo Search with Python API."""
 
-import json
-from typing import Any, Dict, List, Literal, Optional
-from urllib.parse import quote_plus, unquote, urlsplit
+import asyncio
+import atexit
+import string
+import threading
+from typing import Dict, List
+from urllib.parse import quote_plus
 
 import httpx
-from pydantic import BaseModel
-from selectolax.lexbor import LexborHTMLParser as Parser
-
-MD_TAGS = ["strong", "b", "s", "i"]
+import orjson
+
+from ._cache import ttl_cache
+from .errors import YahooParseError
+
+# The parsers and models used to live here; they're still importable from
+# this module.
+from ._parsers import (
+    MD_TAGS,
+    get_abs_image,
+    get_abs_link,
+    parse_news as _parse_news,
+    parse_search as _parse_search,
+    parse_videos as _parse_videos,
+    parse_weather as _parse_weather,
+)
+from .models import (
+    AllSearchResult,
+    AlsoTryItem,
+    CardResult,
+    CardResultSource,
+    HighLowTemperature,
+    News,
+    NewsSearchResult,
+    PageResult,
+    Precipitation,
+    RelatedSearch,
+    SearchResult,
+    Video,
+    VideoSearchResult,
+    WeatherForecast,
+    WeatherForecastInner,
+    WeatherInformation,
+)
+
+_QUOTE_SAFE = frozenset(string.ascii_letters + string.digits + "-._~")
 headers = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -17,115 +52,56 @@ headers = {
     )
 }
 
-class AlsoTryItem(BaseModel):
-    link: str
-    text: str
-
-class PageResult(BaseModel):
-    title: str
-    link: str
-    text: Optional[str] = None
-
-class CardResultSource(BaseModel):
-    link: str
-    text: str
-
-class CardResult(BaseModel):
-    image: Optional[str] = None
-    heading: Optional[str] = None
-    text: Optional[str] = None
-    source: Optional[CardResultSource] = None
-
-class RelatedSearch(BaseModel):
-    link: str
-    text: str
-
-class SearchResult(BaseModel):
-    also_try: List[AlsoTryItem]
-    pages: List[PageResult]
-    card: Optional[CardResult] = None
-    related_searches: List[RelatedSearch]
-
-class News(BaseModel):
-    title: str
-    thumbnail: Optional[str] = None
-    source: Optional[str] = None
-    last_updated: Optional[str] = None
-    text: Optional[str] = None
-
-class NewsSearchResult(BaseModel):
-    news: List[News]
-
-class Video(BaseModel):
-    age: Optional[str] = None
-    cite: Optional[str] = None
-    thumbnail: Optional[str] = None
-    video_preview: Optional[str] = None
-    title: str
-    link: str
-
-class VideoSearchResult(BaseModel):
-    videos: List[Video]
-
-class HighLowTemperature(BaseModel):
-    highest: int
-    lowest: int
-
-class WeatherForecastInner(BaseModel):
-    text: str
-    icon: str
-
-class Precipitation(BaseModel):
-    icon: str
-    percentage: str
-
-class WeatherForecast(BaseModel):
-    fahrenheit: HighLowTemperature
-    celsius: HighLowTemperature
-    weather: WeatherForecastInner
-    precipitation: Precipitation
-
-class WeatherInformation(BaseModel):
-    location: str
-    country: str
-    time: str
-    celsius: int
-    fahrenheit: int
-    weather: str
-    weather_icon: str
-    forecast: Dict[
-        Literal[
-            "Monday", 
-            "Tuesday", 
-            "Wednesday", 
-            "Thursday", 
-            "Friday", 
-            "Saturday", 
-            "Sunday"
-        ],
-        WeatherForecast
-    ]
-    
-
-def get_abs_link(r_search_link: Optional[str]) -> str:
-    if not r_search_link:
-        return ""
-
-    return unquote(
-        urlsplit(r_search_link).path.split("RU=")[1].split('/')[0] # type: ignore
-    )
-
-def get_abs_image(yimg_link: Optional[str]) -> str:
-    if not yimg_link:
-        return ""
-
-    return "https://" + yimg_link.split('https://')[1]
-
-def search(query: str) -> SearchResult:
+# Shared across calls so the keep-alive pool (and the TLS sessions) are reused.
+_CLIENT = httpx.Client(
+    headers=headers,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    timeout=10.0
+)
+atexit.register(_CLIENT.close)
+
+# One async client per event loop, created on first use: pooled connections
+# belong to the loop they were opened on and can't be reused on another one.
+_ACLIENTS: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+_ACLIENTS_LOCK = threading.Lock()
+
+def _check_max_results(max_results: int) -> None:
+    if max_results < 0:
+        raise ValueError(
+            "max_results must be 0 (no limit) or more, got {}".format(max_results)
+        )
+
+def _fast_quote(query: str) -> str:
+    """Same as ``quote_plus``, with shortcuts for plain ASCII queries."""
+    unsafe = set(query) - _QUOTE_SAFE
+
+    if not unsafe:
+        return query
+
+    if unsafe == {" "}:
+        return query.replace(" ", "+")
+
+    return quote_plus(query)
+
+@ttl_cache(maxsize=512, ttl=60)
+def search(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> SearchResult:
     """Searches Yahoo using a text query.
 
+    Results are cached for 60 seconds.
+
     Args:
         query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
     Example:
         .. code-block :: python
@@ -141,108 +117,20 @@ def search(query: str) -> SearchResult:
 
     Returns:
         SearchResult: The search result.
+
+    Raises:
+        YahooParseError: If the search results can't be found on the page.
     """
-    client = httpx.Client()
-    res = client.get(
+    _check_max_results(max_results)
+
+    res = _CLIENT.get(
         "https://sg.search.yahoo.com/search?q={}".format(
-            quote_plus(query)
-        ), 
-        headers=headers
+            _fast_quote(query)
+        )
     )
     res.raise_for_status()
 
-    parser = Parser(res.text)
-    search = parser.css_first(".reg.searchCenterMiddle")
-    contents = {
-        "also_try": [],
-        "pages": [],
-        "card": {},
-        "related_searches": []
-    }
-
-    assert search, "Could not find '.reg.searchCCenterMiddle' (search results)"
-
-    for webpage in search.css(".dd.algo.algo-sr"):
-        page_results = {}
-    
-        for title in webpage.css("div.compTitle h3 a"):
-            link = title.attributes['href']
-            absLink = get_abs_link(link)
-            title = title.last_child.text() if title.last_child else ""
-            page_results.update({
-                "title": title,
-                "link": absLink
-            })
-
-        for texts in webpage.css(".compText.aAbs p"):
-            texts.unwrap_tags(MD_TAGS)
-            text = texts.text(deep=True, separator=" ", strip=True)
-            page_results.update({
-                "text": text
-            })
-
-        contents['pages'].append(page_results)
-
-    card = parser.css_first(".cardReg.searchRightTop")
-
-    if card:
-        image = card.css_first('img')
-
-        if image:
-            contents["card"]["image"] = get_abs_image(
-                image.attributes['src']
-            )
-
-        heading_2 = card.css_first('p.pl-15.pr-10 span')
-
-        if heading_2:
-            heading_2.unwrap_tags(MD_TAGS)
-            text = heading_2.text(deep=True, separator=" ", strip=True)
-            contents["card"]["heading"] = text
-
-        inner_content = card.css_first('div.compText p')
-
-        if inner_content:
-            text = inner_content.first_child
-            contents["card"]["text"] = text.text() if text else ""
-
-            source = inner_content.css_first("a")
-    
-            if source:
-                contents["card"]["source"] = {
-                    "link": get_abs_link(
-                        source.attributes.get("href")
-                    ),
-                    "text": source.text()
-                }
-
-    also_try = parser.css(
-        'ol.cardReg.searchTop .compDlink li span a'
-    )
-
-    if also_try:
-        for item in also_try:
-            contents["also_try"].append({
-                "link": item.attributes['href'],
-                "text": item.text()
-            })
-
-    related_searches = parser.css(
-        'ol.scf.reg.searchCenterFooter tbody tr td a'
-    )
-
-    if related_searches:
-        for item in related_searches:
-            item.unwrap_tags(MD_TAGS)
-            text = item.text(deep=True, separator=" ", strip=True)
-
-            contents["related_searches"].append({
-                "link": item.attributes['href'],
-                "text": text
-            })
-    
-
-    return SearchResult(**contents)
+    return _parse_search(res.content, max_results, validate)
 
 def query_to_tabs(query: str) -> Dict[str, str]:
     """Converts a query to tab item links.
@@ -271,11 +159,21 @@ def query_to_tabs(query: str) -> Dict[str, str]:
         "videos": "https://sg.video.search.yahoo.com/search?q=" + query
     }
 
-def search_news(query: str) -> NewsSearchResult:
+def search_news(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> NewsSearchResult:
     """Searches news on Yahoo.
 
     Args:
         query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
     Example:
         .. code-block :: python
@@ -283,72 +181,33 @@ def search_news(query: str) -> NewsSearchResult:
             n = search_news("taiwan")
             print(n.news[0].title)
             # Nearly 200 people injured as Typhoon Koinu brings(...)
-    """
-    tabs = query_to_tabs(quote_plus(query))
-
-    client = httpx.Client()
-    res = client.get(
-        tabs['news'],
-        headers=headers
-    )
-
-    parser = Parser(res.text)
-    page = parser.css_first('#main #web')
-    assert page, "Could not find '#main #web' (news results)"
-
-    contents = []
-
-    for news in page.css('li .dd.NewsArticle li'):
-        this = {}
-        thumbnail = news.css_first('img')
-
-        if thumbnail:
-            src = thumbnail.attributes['src']
-            this.update({
-                "thumbnail": None if src.startswith('data:image/') else src # type: ignore
-            })
-
-        title = news.css_first('h4 a')
-
-        if title:
-            this.update({
-                "title": title.text(),
-                "link": title.attributes['href']
-            })
-
-        source = news.css_first('span.s-source')
-
-        if source:
-            this.update({
-                "source": source.text()
-            })
 
-        last_updated = news.css_first('span.fc-2nd.s-time')
-
-        if last_updated:
-            this.update({
-                "time": last_updated.text()[2:]
-            })
-
-        description = news.css_first('p.s-desc')
-
-        if description:
-            description.unwrap_tags(MD_TAGS)
-            text = description.text(deep=True, separator=" ", strip=True)
-            this.update({
-                "text": text
-            })
+    Raises:
+        YahooParseError: If the news results can't be found on the page.
+    """
+    _check_max_results(max_results)
 
+    tabs = query_to_tabs(_fast_quote(query))
 
-        contents.append(this)
+    res = _CLIENT.get(tabs['news'])
 
-    return NewsSearchResult(news=contents)
+    return _parse_news(res.content, max_results, validate)
 
-def search_videos(query: str) -> VideoSearchResult:
+def search_videos(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> VideoSearchResult:
     """Searches videos on Yahoo.
 
     Args:
         query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
     Example:
         .. code-block :: python
@@ -359,249 +218,333 @@ def search_videos(query: str) -> VideoSearchResult:
 
     Returns:
         VideoSearchResult: Search results.
+
+    Raises:
+        YahooParseError: If the video results can't be found on the page.
     """
-    tabs = query_to_tabs(quote_plus(query))
+    _check_max_results(max_results)
 
-    client = httpx.Client()
-    res = client.get(
-        tabs['videos'],
-        headers=headers
-    )
-    res.raise_for_status()
+    tabs = query_to_tabs(_fast_quote(query))
 
-    parser = Parser(res.text)
-    contents = []
+    res = _CLIENT.get(tabs['videos'])
+    res.raise_for_status()
 
-    results = parser.css('#search li.vr.vres')
-    assert results, "Couldn't find any results for '#search li.vr.vres'"
-    
-    for result in results:
-        this = {}
-        anchor = result.css_first("a")
+    return _parse_videos(res.content, max_results, validate)
 
-        if anchor:
-            this.update({
-                "link": "https://sg.video.search.yahoo.com" + anchor.attributes['href'] # type: ignore
-            })
+@ttl_cache(maxsize=512, ttl=600)
+def weather(validate: bool = False) -> WeatherInformation:
+    """Fetches weather in this location.
 
-            preview = anchor.attributes.get("data")
+    Results are cached for 10 minutes.
 
-            if preview:
-                meta = json.loads(preview)
-                if meta['m']: # sometimes nothing
-                    this.update({
-                        "video_preview": meta['m']['u']
-                    })
+    Args:
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; forecast
+            days missing a column are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
-        thumbnail = result.css_first("img")
+    Example:
+        .. code-block :: python
 
-        if thumbnail:
-            this.update({
-                "thumbnail": thumbnail.attributes['src']
-            })
+            w = weather()
+            print(w.celsius)
+            # 38
+            print(
+                w.forecast['Monday'].fahrenheit # monday weather forecast
+            )
+            # HighLowTemperature(
+            #   highest=92
+            #   lowest=78
+            # )
 
+    Raises:
+        YahooParseError: If the current weather can't be found on the page.
+    """
+    res = _CLIENT.get("https://sg.news.yahoo.com/weather/")
 
-        duration = result.css_first('div.pos-box .vthm .stack.grad span.v-time')
+    return _parse_weather(res.content, validate)
 
-        if duration:
-            this.update({
-                "duration": duration.text()
-            })
+@ttl_cache(maxsize=512, ttl=300)
+def autocomplete(query: str) -> List[str]:
+    """Autocompletes a query.
 
-        metadata = result.css_first('div.v-meta')
+    Results are cached for 5 minutes.
 
-        if metadata:
-            title = metadata.first_child
+    Args:
+        query (str): The query.
 
-            if title:
-                title.unwrap_tags(MD_TAGS)
-                this.update({
-                    "title": title.text(deep=True, separator=" ", strip=True)
-                })
+    Example:
+        .. code-block :: python
 
-            age = metadata.css_first('.v-age')
+            while True:
+                print(
+                    autocomplete(
+                        input("search: ")
+                    )
+                )
+    """
 
-            if age:
-                this.update({
-                    "age": age.text()
-                })
+    res = _CLIENT.get(
+        "https://ff.search.yahoo.com/gossip?output=fxjson&query={}".format(
+            _fast_quote(query)
+        )
+    )
+    return orjson.loads(res.content)[1]
+
+def _new_aclient() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=headers,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        timeout=10.0
+    )
 
-            cite = metadata.last_child
+def _get_aclient() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
 
-            if cite:
-                this.update({
-                    "cite": cite.text()
-                })
+    with _ACLIENTS_LOCK:
+        # Clients of closed loops are unusable (and can't be closed anymore)
+        for closed in [other for other in _ACLIENTS if other.is_closed()]:
+            del _ACLIENTS[closed]
 
-        contents.append(this)
+        client = _ACLIENTS.get(loop)
 
-    return VideoSearchResult(videos=contents)
+        if client is None or client.is_closed:
+            client = _ACLIENTS[loop] = _new_aclient()
 
-def weather() -> WeatherInformation:
-    """Fetches weather in this location.
+    return client
 
-    Example:
-        .. code-block :: python
+async def aclose() -> None:
+    """Closes the async client of the running event loop.
 
-            w = weather()
-            print(w.celsius)
-            # 38
-            print(
-                w.forecast['Monday'].fahrenheit # monday weather forecast
-            )
-            # HighLowTemperature(
-            #   highest=92
-            #   lowest=78
-            # )
+    Call it before the loop ends, e.g. at the end of the coroutine given to
+    ``asyncio.run()``. The next async call opens a new client.
     """
-    client = httpx.Client()
-    res = client.get(
-        "https://sg.news.yahoo.com/weather/",
-        headers=headers
-    )
-    parser = Parser(res.text)
+    with _ACLIENTS_LOCK:
+        client = _ACLIENTS.pop(asyncio.get_running_loop(), None)
 
-    data: Dict[str, Any] = {
-        "forecast": {}
-    }
+    if client is not None:
+        await client.aclose()
 
-    location = parser.css_first('div.M\\(10px\\) h1')
+async def asearch(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> SearchResult:
+    """Searches Yahoo using a text query, asynchronously.
 
-    if location:
-        data.update({
-            "location": location.text()
-        })
+    See :func:`search`.
 
-    country = parser.css_first('h2.D\\(b\\)')
+    Args:
+        query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
-    if country:
-        data.update({
-            "country": country.text()
-        })
+    Returns:
+        SearchResult: The search result.
 
-    now = parser.css_first('time')
+    Raises:
+        YahooParseError: If the search results can't be found on the page.
+    """
+    _check_max_results(max_results)
 
-    if now:
-        data.update({
-            "time": now.text()
-        })
+    res = await _get_aclient().get(
+        "https://sg.search.yahoo.com/search?q={}".format(
+            _fast_quote(query)
+        )
+    )
+    res.raise_for_status()
 
-    celsius = parser.css_first('.celsius.celsius_D\\(b\\)')
+    return _parse_search(res.content, max_results, validate)
 
-    if celsius:
-        data.update({
-            "celsius": int(celsius.text())
-        })
+async def asearch_news(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> NewsSearchResult:
+    """Searches news on Yahoo, asynchronously.
 
-    fahrenheit = parser.css_first('.fahrenheit')
+    See :func:`search_news`.
 
-    if fahrenheit:
-        data.update({
-            "fahrenheit": int(fahrenheit.text())
-        })
+    Args:
+        query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
+
+    Raises:
+        YahooParseError: If the news results can't be found on the page.
+    """
+    _check_max_results(max_results)
 
-    weather = parser.css_first('div#module-location-heading')
+    tabs = query_to_tabs(_fast_quote(query))
+    res = await _get_aclient().get(tabs['news'])
 
-    if weather:
-        img = weather.css_first('img')
+    return _parse_news(res.content, max_results, validate)
 
-        if img:
-            data.update({
-                "weather_icon": img.attributes['src']
-            })
+async def asearch_videos(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> VideoSearchResult:
+    """Searches videos on Yahoo, asynchronously.
 
-        text = weather.css_first('p')
+    See :func:`search_videos`.
 
-        if text:
-            data.update({
-                "weather": text.text()
-            })
+    Args:
+        query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
-        weather_table = parser.css('table[data-slk="sec:forecast;"] tbody tr')
+    Returns:
+        VideoSearchResult: Search results.
 
-        if weather_table:
-            for row in weather_table[:7]:
-                day = row.first_child.last_child.text() # type: ignore
-                info = {
-                    "fahrenheit": {},
-                    "celsius": {}
-                }
+    Raises:
+        YahooParseError: If the video results can't be found on the page.
+    """
+    _check_max_results(max_results)
 
-                weather = row.css_first('td.Ta\\(c\\) img')
+    tabs = query_to_tabs(_fast_quote(query))
+    res = await _get_aclient().get(tabs['videos'])
+    res.raise_for_status()
 
-                if weather:
-                    info.update({
-                        "weather": {
-                            "text": weather.attributes['alt'],
-                            "icon": weather.attributes['src']
-                        }
-                    })
+    return _parse_videos(res.content, max_results, validate)
 
-                precipitation = row.css_first('td.D\\(f\\).Jc\\(c\\)')
+async def aweather(validate: bool = False) -> WeatherInformation:
+    """Fetches weather in this location, asynchronously.
 
-                if precipitation:
-                    img = precipitation.first_child
-                    percentage = precipitation.last_child.last_child # type: ignore
-                    
-                    info.update({
-                        "precipitation": {
-                            "icon": img.attributes['src'], # type: ignore
-                            "percentage": percentage.text() # type: ignore
-                        }
-                    })
+    See :func:`weather`.
 
-                hl_temp = row.css('td.D\\(f\\).Jc\\(fe\\).Ta\\(end\\) dl dd')
+    Args:
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; forecast
+            days missing a column are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
-                if hl_temp:
-                    for index, item in enumerate(hl_temp):
-                        text = item.text()[:-1]
+    Raises:
+        YahooParseError: If the current weather can't be found on the page.
+    """
+    res = await _get_aclient().get("https://sg.news.yahoo.com/weather/")
 
-                        if index == 0:
-                            info["fahrenheit"].update({
-                                "highest": int(text)
-                            })
+    return _parse_weather(res.content, validate)
 
-                        elif index == 1:
-                            info["celsius"].update({
-                                "highest": int(text)
-                            })
+async def aautocomplete(query: str) -> List[str]:
+    """Autocompletes a query, asynchronously.
 
-                        elif index == 2:
-                            info["fahrenheit"].update({
-                                "lowest": int(text)
-                            })
+    See :func:`autocomplete`.
 
-                        else:
-                            info["celsius"].update({
-                                "lowest": int(text)
-                            })
+    Args:
+        query (str): The query.
+    """
+    res = await _get_aclient().get(
+        "https://ff.search.yahoo.com/gossip?output=fxjson&query={}".format(
+            _fast_quote(query)
+        )
+    )
+    return orjson.loads(res.content)[1]
+
+async def _search_all(
+    query: str,
+    client: httpx.AsyncClient,
+    max_results: int,
+    validate: bool
+) -> AllSearchResult:
+    quoted = _fast_quote(query)
+    tabs = query_to_tabs(quoted)
+
+    web, news, videos = await asyncio.gather(
+        client.get("https://sg.search.yahoo.com/search?q=" + quoted),
+        client.get(tabs['news']),
+        client.get(tabs['videos'])
+    )
+    web.raise_for_status()
+    videos.raise_for_status()
+
+    build = AllSearchResult if validate else AllSearchResult.model_construct
+    return build(
+        web=_parse_search(web.content, max_results, validate),
+        news=_parse_news(news.content, max_results, validate),
+        videos=_parse_videos(videos.content, max_results, validate)
+    )
 
-                data["forecast"][day] = info
+async def asearch_all(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> AllSearchResult:
+    """Searches web pages, news and videos on Yahoo concurrently, asynchronously.
+
+    Args:
+        query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
-    return WeatherInformation(**data)
+    Returns:
+        AllSearchResult: The web, news and video results.
 
-def autocomplete(query: str) -> List[str]:
-    """Autocompletes a query.
+    Raises:
+        YahooParseError: If any of the results can't be found on their page.
+    """
+    _check_max_results(max_results)
+
+    return await _search_all(query, _get_aclient(), max_results, validate)
+
+def search_all(
+    query: str,
+    max_results: int = 0,
+    validate: bool = False
+) -> AllSearchResult:
+    """Searches web pages, news and videos on Yahoo concurrently.
+
+    The three requests are sent at once, so this takes about as long as the
+    slowest one. Cannot be called from a running event loop; use
+    :func:`asearch_all` there instead.
 
     Args:
         query (str): The query.
+        max_results (int): Stop after this many results. ``0`` means no
+            limit; negative values raise ``ValueError``.
+        validate (bool): Whether to validate the result with Pydantic.
+            Off by default, since the parser's output is trusted; results
+            missing a required field are then left out, where validating
+            raises ``pydantic.ValidationError`` for them.
 
     Example:
         .. code-block :: python
 
-            while True:
-                print(
-                    autocomplete(
-                        input("search: ")
-                    )
-                )
+            a = search_all("chocolate")
+            print(a.web.pages[0].title)
+            # Chocolate - Wikipedia
+            print(a.news.news[0].title)
+            print(a.videos.videos[0].link)
+
+    Returns:
+        AllSearchResult: The web, news and video results.
+
+    Raises:
+        YahooParseError: If any of the results can't be found on their page.
     """
+    _check_max_results(max_results)
 
-    client = httpx.Client()
-    res = client.get(
-        "https://ff.search.yahoo.com/gossip?output=fxjson&query={}".format(
-            quote_plus(query)
-        ),
-        headers=headers
-    )
-    return res.json()[1]
+    async def runner() -> AllSearchResult:
+        # asyncio.run() closes its loop afterwards, so the connections can't
+        # be pooled in the shared async client.
+        async with _new_aclient() as client:
+            return await _search_all(query, client, max_results, validate)
+
+    return asyncio.run(runner())
@@ -0,0 +1,9 @@
+"""Exceptions."""
+
+class YahooParseError(RuntimeError):
+    """Raised when a Yahoo page doesn't have the expected structure.
+
+    Usually that means Yahoo changed its markup, or served a page without
+    results (e.g. a captcha). Catch this rather than ``AssertionError``,
+    which older versions raised (and which ``python -O`` would skip).
+    """
@@ -0,0 +1,145 @@
+"""Result models."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel
+
+class _Slotted:
+    """Pickling and copy support for the frozen, slotted dataclasses below.
+
+    These are the ``__getstate__``/``__setstate__`` that
+    ``dataclass(slots=True)`` would add; without them, unpickling (and
+    ``copy``) tries to set the frozen fields and fails.
+    """
+    __slots__: Tuple[str, ...] = ()
+
+    def __getstate__(self) -> List[Any]:
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    # Frozen and made of str/int fields only, so a copy can be the same
+    # instance (the cache deep-copies every result it returns)
+    def __copy__(self) -> "_Slotted":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_Slotted":
+        return self
+
+# Plain values are slotted dataclasses rather than models: they carry no
+# validation logic of their own and there can be many of them per page.
+# (__slots__ is spelled out as dataclass(slots=True) needs Python 3.10.)
+@dataclass(frozen=True)
+class AlsoTryItem(_Slotted):
+    __slots__ = ("link", "text")
+
+    link: str
+    text: str
+
+class PageResult(BaseModel):
+    title: str
+    link: str
+    text: Optional[str] = None
+
+@dataclass(frozen=True)
+class CardResultSource(_Slotted):
+    __slots__ = ("link", "text")
+
+    link: str
+    text: str
+
+class CardResult(BaseModel):
+    image: Optional[str] = None
+    heading: Optional[str] = None
+    text: Optional[str] = None
+    source: Optional[CardResultSource] = None
+
+@dataclass(frozen=True)
+class RelatedSearch(_Slotted):
+    __slots__ = ("link", "text")
+
+    link: str
+    text: str
+
+class SearchResult(BaseModel):
+    also_try: List[AlsoTryItem]
+    pages: List[PageResult]
+    card: Optional[CardResult] = None
+    related_searches: List[RelatedSearch]
+
+class News(BaseModel):
+    title: str
+    thumbnail: Optional[str] = None
+    source: Optional[str] = None
+    last_updated: Optional[str] = None
+    text: Optional[str] = None
+
+class NewsSearchResult(BaseModel):
+    news: List[News]
+
+class Video(BaseModel):
+    age: Optional[str] = None
+    cite: Optional[str] = None
+    thumbnail: Optional[str] = None
+    video_preview: Optional[str] = None
+    title: str
+    link: str
+
+class VideoSearchResult(BaseModel):
+    videos: List[Video]
+
+class AllSearchResult(BaseModel):
+    web: SearchResult
+    news: NewsSearchResult
+    videos: VideoSearchResult
+
+@dataclass(frozen=True)
+class HighLowTemperature(_Slotted):
+    __slots__ = ("highest", "lowest")
+
+    highest: int
+    lowest: int
+
+@dataclass(frozen=True)
+class WeatherForecastInner(_Slotted):
+    __slots__ = ("text", "icon")
+
+    text: str
+    icon: str
+
+@dataclass(frozen=True)
+class Precipitation(_Slotted):
+    __slots__ = ("icon", "percentage")
+
+    icon: str
+    percentage: str
+
+class WeatherForecast(BaseModel):
+    fahrenheit: HighLowTemperature
+    celsius: HighLowTemperature
+    weather: WeatherForecastInner
+    precipitation: Precipitation
+
+class WeatherInformation(BaseModel):
+    location: str
+    country: str
+    time: str
+    celsius: int
+    fahrenheit: int
+    weather: str
+    weather_icon: str
+    forecast: Dict[
+        Literal[
+            "Monday", 
+            "Tuesday", 
+            "Wednesday", 
+            "Thursday", 
+            "Friday", 
+            "Saturday", 
+            "Sunday"
+        ],
+        WeatherForecast
+    ]